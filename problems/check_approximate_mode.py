@@ -0,0 +1,167 @@
+"""
+This module checks the approximate query mode against the exact results
+on the shipped IPL data.
+
+It runs each analysis exactly and with sketches, prints the observed error
+next to the documented bound, and exits with a non-zero status if any
+observed error is outside its bound:
+
+- Distinct counts (HyperLogLog) must be within three relative standard
+  errors of the exact count.
+- The approximate top ten RCB batsmen must be the exact top ten, and each
+  total may overcount by at most the sketch's error_bound() and never
+  undercount.
+
+Both checks are also run on sketches built per season and merged, against
+the exact result over all seasons.
+"""
+
+import sys
+
+from problem_2 import (
+    build_batsman_runs_sketch_of_rcb,
+    build_batsman_runs_sketches_of_rcb_per_season,
+    calculate_top_ten_batsman_of_rcb,
+)
+from problem_9 import (
+    calculate_number_of_bowlers_per_team,
+    calculate_number_of_players_per_season,
+    collect_players_per_season,
+)
+from sketches import HyperLogLog
+
+
+def check_distinct_counts(name, exact_counts, approximate_counts):
+    """
+    Compare exact and approximate distinct counts against the HyperLogLog bound.
+
+    Args:
+        name (str): Name of the analysis, used in the printed report.
+        exact_counts (dict): Keys mapped to exact distinct counts.
+        approximate_counts (dict): Keys mapped to approximate distinct counts.
+
+    Returns:
+        list: A list of failure messages, empty if every count is within bound.
+    """
+    failures = []
+    allowed_error = 3 * HyperLogLog().relative_error()
+    worst_error = 0
+
+    for key, exact_count in exact_counts.items():
+        relative_error = abs(approximate_counts[key] - exact_count) / exact_count
+        worst_error = max(worst_error, relative_error)
+
+        if relative_error > allowed_error:
+            failures.append(f"{name} {key}: {approximate_counts[key]} against exact "
+                            f"{exact_count} ({relative_error:.2%} > {allowed_error:.2%})")
+
+    print(f"{name}: worst relative error {worst_error:.2%}, allowed {allowed_error:.2%}")
+    return failures
+
+
+def check_merged_players(exact_players_per_season, players_sketches_per_season):
+    """
+    Merge the per-season player sketches and compare the result with the exact
+    number of distinct players across all seasons.
+
+    Args:
+        exact_players_per_season (dict): Seasons mapped to exact sets of players.
+        players_sketches_per_season (dict): Seasons mapped to HyperLogLog sketches.
+
+    Returns:
+        list: A list of failure messages, empty if the merged count is within bound.
+    """
+    merged_players = HyperLogLog()
+
+    for players_sketch in players_sketches_per_season.values():
+        merged_players.merge(players_sketch)
+
+    exact_players = set().union(*exact_players_per_season.values())
+
+    return check_distinct_counts(
+        "Players across all seasons (merged)",
+        {"all seasons": len(exact_players)},
+        {"all seasons": merged_players.count()})
+
+
+def check_top_ten_batsman_of_rcb(name, exact_top_ten, batsman_runs_sketch):
+    """
+    Compare a sketch's top ten RCB batsmen with the exact ones.
+
+    Args:
+        name (str): Name of the check, used in the printed report.
+        exact_top_ten (dict): The exact top ten batsmen mapped to their runs.
+        batsman_runs_sketch (HeavyHitters): The sketch of batsmen's runs.
+
+    Returns:
+        list: A list of failure messages, empty if the leaderboard is within bound.
+    """
+    failures = []
+    approximate_top_ten = batsman_runs_sketch.top(10)
+    error_bound = batsman_runs_sketch.error_bound()
+
+    missing_batsmen = set(exact_top_ten) - set(approximate_top_ten)
+    extra_batsmen = set(approximate_top_ten) - set(exact_top_ten)
+    if missing_batsmen or extra_batsmen:
+        failures.append(f"{name}: missing {sorted(missing_batsmen)}, "
+                        f"unexpected {sorted(extra_batsmen)}")
+
+    worst_overcount = 0
+    for batsman, runs in exact_top_ten.items():
+        if batsman not in approximate_top_ten:
+            continue
+
+        error = approximate_top_ten[batsman] - runs
+        if error < 0:
+            failures.append(f"{name} {batsman}: undercount of {-error}")
+        elif error > error_bound:
+            failures.append(f"{name} {batsman}: overcount of {error} > {error_bound:.0f}")
+        worst_overcount = max(worst_overcount, error)
+
+    print(f"{name}: same ranking:", list(exact_top_ten) == list(approximate_top_ten))
+    print(f"  worst overcount {worst_overcount}, allowed {error_bound:.0f}, "
+          f"membership bound {batsman_runs_sketch.membership_bound():.0f}")
+    return failures
+
+
+def execute():
+    """
+    Run every check and exit with a non-zero status if any of them fails.
+    """
+    failures = []
+
+    failures += check_distinct_counts(
+        "Players per season",
+        calculate_number_of_players_per_season(),
+        calculate_number_of_players_per_season(approximate=True))
+
+    failures += check_distinct_counts(
+        "Bowlers per team",
+        calculate_number_of_bowlers_per_team(),
+        calculate_number_of_bowlers_per_team(approximate=True))
+
+    failures += check_merged_players(
+        collect_players_per_season(),
+        collect_players_per_season(approximate=True))
+
+    exact_top_ten = calculate_top_ten_batsman_of_rcb()
+    failures += check_top_ten_batsman_of_rcb(
+        "Top ten RCB batsmen", exact_top_ten, build_batsman_runs_sketch_of_rcb())
+
+    season_sketches = list(build_batsman_runs_sketches_of_rcb_per_season().values())
+    merged_batsman_runs = season_sketches[0]
+    for batsman_runs_sketch in season_sketches[1:]:
+        merged_batsman_runs.merge(batsman_runs_sketch)
+
+    failures += check_top_ten_batsman_of_rcb(
+        "Top ten RCB batsmen (merged seasons)", exact_top_ten, merged_batsman_runs)
+
+    if failures:
+        sys.exit("Approximate mode outside its error bounds:\n" + "\n".join(failures))
+
+    print("Approximate mode is within its error bounds.")
+
+
+if __name__ == "__main__":
+
+    execute()
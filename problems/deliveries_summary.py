@@ -0,0 +1,154 @@
+"""
+This module materializes a per-match, per-innings, per-bowler summary
+of the IPL deliveries data.
+
+It reads the 'deliveries.csv' file once, reduces every ball to one row
+per (match, innings, bowler) with the runs, extras, wickets and legal
+balls of that spell, and writes the result to 'deliveries_summary.csv'.
+The size and modification time of the 'deliveries.csv' it was built from
+are saved next to it, and the summary is rebuilt whenever they change, so
+analyses that only need innings-level facts can read it instead of
+re-aggregating every ball.
+"""
+
+import csv
+import os
+
+DELIVERIES_PATH = "../required_data/deliveries.csv"
+SUMMARY_PATH = "../required_data/deliveries_summary.csv"
+SOURCE_FINGERPRINT_PATH = SUMMARY_PATH + ".source"
+
+SUMMARY_KEY_FIELDS = ["match_id", "inning", "batting_team", "bowling_team", "bowler"]
+SUMMARY_VALUE_FIELDS = [
+    "total_runs",
+    "extra_runs",
+    "bye_runs",
+    "legbye_runs",
+    "wickets",
+    "bowler_wickets",
+    "legal_balls",
+]
+
+NON_BOWLER_DISMISSALS = {"run out", "retired hurt", "obstructing the field"}
+
+
+def get_deliveries_fingerprint():
+    """
+    Describe the current 'deliveries.csv' by its size and modification time.
+
+    Returns:
+        str: The fingerprint of 'deliveries.csv'.
+    """
+    source_stat = os.stat(DELIVERIES_PATH)
+    return f"{source_stat.st_size} {source_stat.st_mtime_ns}"
+
+
+def build_deliveries_summary():
+    """
+    Reduce 'deliveries.csv' to one row per match, innings and bowler and
+    write it to 'deliveries_summary.csv'.
+
+    'wickets' counts every delivery with a 'player_dismissed', so summing it
+    gives the wickets of an innings. 'bowler_wickets' leaves out run outs,
+    retired hurt and obstructing the field, which are not credited to the
+    bowler. A legal ball is any delivery without wide or no-ball runs.
+
+    Returns:
+        None
+    """
+    summary = {}
+    source_fingerprint = get_deliveries_fingerprint()
+
+    with open(DELIVERIES_PATH, encoding="utf-8") as delivery_file:
+        delivery_data = csv.DictReader(delivery_file)
+
+        for delivery in delivery_data:
+            key = tuple(delivery[field] for field in SUMMARY_KEY_FIELDS)
+
+            if key not in summary:
+                summary[key] = dict.fromkeys(SUMMARY_VALUE_FIELDS, 0)
+            totals = summary[key]
+
+            totals["total_runs"] += int(delivery["total_runs"])
+            totals["extra_runs"] += int(delivery["extra_runs"])
+            totals["bye_runs"] += int(delivery["bye_runs"])
+            totals["legbye_runs"] += int(delivery["legbye_runs"])
+
+            if delivery["player_dismissed"]:
+                totals["wickets"] += 1
+
+                if delivery["dismissal_kind"] not in NON_BOWLER_DISMISSALS:
+                    totals["bowler_wickets"] += 1
+
+            if int(delivery["wide_runs"]) == 0 and int(delivery["noball_runs"]) == 0:
+                totals["legal_balls"] += 1
+
+    # Write to a temporary file first so a half-written summary is never read.
+    temporary_path = SUMMARY_PATH + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8", newline="") as summary_file:
+        writer = csv.writer(summary_file)
+        writer.writerow(SUMMARY_KEY_FIELDS + SUMMARY_VALUE_FIELDS)
+
+        for key, totals in summary.items():
+            writer.writerow(list(key) + [totals[field] for field in SUMMARY_VALUE_FIELDS])
+
+    os.replace(temporary_path, SUMMARY_PATH)
+
+    with open(SOURCE_FINGERPRINT_PATH, "w", encoding="utf-8") as fingerprint_file:
+        fingerprint_file.write(source_fingerprint)
+
+
+def is_deliveries_summary_stale():
+    """
+    Check whether 'deliveries_summary.csv' is missing, was built from a
+    'deliveries.csv' with a different size or modification time, or was
+    written with different columns.
+
+    The fingerprint is compared for equality rather than age, because
+    extracting 'deliveries.csv' from the zip keeps its archived, older
+    modification time.
+
+    Returns:
+        bool: True if the summary needs to be rebuilt, False otherwise.
+    """
+    if not os.path.exists(SUMMARY_PATH) or not os.path.exists(SOURCE_FINGERPRINT_PATH):
+        return True
+
+    with open(SOURCE_FINGERPRINT_PATH, encoding="utf-8") as fingerprint_file:
+        if fingerprint_file.read() != get_deliveries_fingerprint():
+            return True
+
+    with open(SUMMARY_PATH, encoding="utf-8") as summary_file:
+        header = next(csv.reader(summary_file), [])
+
+    return header != SUMMARY_KEY_FIELDS + SUMMARY_VALUE_FIELDS
+
+
+def read_deliveries_summary():
+    """
+    Read the per-match, per-innings, per-bowler summary, rebuilding it
+    first if it is out of date with 'deliveries.csv'.
+
+    Returns:
+        list: A list of dictionaries, one per summary row, with the key
+              fields as strings and the value fields as integers.
+    """
+    if is_deliveries_summary_stale():
+        build_deliveries_summary()
+
+    summary_rows = []
+
+    with open(SUMMARY_PATH, encoding="utf-8") as summary_file:
+        summary_data = csv.DictReader(summary_file)
+
+        for row in summary_data:
+            for field in SUMMARY_VALUE_FIELDS:
+                row[field] = int(row[field])
+            summary_rows.append(row)
+
+    return summary_rows
+
+
+if __name__ == "__main__":
+
+    build_deliveries_summary()
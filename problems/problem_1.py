@@ -6,10 +6,11 @@ It reads data from the 'deliveries.csv' file, processes the
 total runs for each team, and displays the results in a bar chart.
 """
 
-import csv
 import matplotlib
 import matplotlib.pyplot as plt
 
+from deliveries_summary import read_deliveries_summary
+
 # Set backend immediately after importing matplotlib
 matplotlib.use('TkAgg')
 
@@ -18,7 +19,8 @@ def calculate_total_runs_by_team():
     """
     Calculate the total runs scored by each team in the IPL based on the deliveries dataset.
 
-    Reads data from 'deliveries.csv', and aggregates total runs for each batting team.
+    Reads the per-innings summary derived from 'deliveries.csv', and aggregates
+    total runs for each batting team.
     Special case: normalizes 'Rising Pune Supergiants' to 'Rising Pune Supergiant'.
 
     Returns:
@@ -26,17 +28,14 @@ def calculate_total_runs_by_team():
     """
     total_runs_by_team = {}
 
-    with open("../required_data/deliveries.csv", encoding="utf-8") as data:
-        deliveries_data = csv.DictReader(data)
-
-        for delivery in deliveries_data:
-            batting_team = delivery["batting_team"]
-            runs_scored = int(delivery["total_runs"])
+    for innings in read_deliveries_summary():
+        batting_team = innings["batting_team"]
+        runs_scored = innings["total_runs"]
 
-            if batting_team == "Rising Pune Supergiants":
-                batting_team = "Rising Pune Supergiant"
+        if batting_team == "Rising Pune Supergiants":
+            batting_team = "Rising Pune Supergiant"
 
-            total_runs_by_team[batting_team] = total_runs_by_team.get(batting_team,0) + runs_scored
+        total_runs_by_team[batting_team] = total_runs_by_team.get(batting_team,0) + runs_scored
 
     return total_runs_by_team
 
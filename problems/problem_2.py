@@ -7,21 +7,98 @@ top ten batsman for RCB and displays the results in a bar chart.
 """
 
 import csv
+import sys
 import matplotlib
 import matplotlib.pyplot as plt
 
+from sketches import HeavyHitters
+
 # Set backend immediately after importing matplotlib
 matplotlib.use('TkAgg')
 
-def calculate_top_ten_batsman_of_rcb():
+def build_batsman_runs_sketch_of_rcb(capacity=30):
+    """
+    Build a heavy-hitters sketch of runs scored by Royal Challengers Bangalore (RCB)
+    batsmen, keeping at most `capacity` candidate batsmen in memory.
+
+    With probability 0.99 each total from the sketch's top() overcounts by at
+    most its error_bound(), 1% of all RCB runs. A batsman whose true total is
+    at or below its membership_bound() may be missing from top().
+
+    Args:
+        capacity (int): Number of candidate batsmen kept by the sketch.
+
+    Returns:
+        HeavyHitters: The sketch of batsmen's runs.
+    """
+    batsman_runs_sketch = HeavyHitters(capacity)
+
+    with open("../required_data/deliveries.csv", encoding="utf-8") as data:
+        deliveries_data = csv.DictReader(data)
+
+        for delivery in deliveries_data:
+            if delivery["batting_team"] == "Royal Challengers Bangalore":
+                batsman_runs_sketch.add(delivery["batsman"], int(delivery["batsman_runs"]))
+
+    return batsman_runs_sketch
+
+
+def build_batsman_runs_sketches_of_rcb_per_season(capacity=30):
+    """
+    Build one heavy-hitters sketch of RCB batsmen's runs per season, so the
+    seasons can be merged into a single leaderboard.
+
+    Deliveries of matches missing from 'matches.csv' are skipped.
+
+    Args:
+        capacity (int): Number of candidate batsmen kept by each sketch.
+
+    Returns:
+        dict: A dictionary with seasons (integers) as keys and HeavyHitters
+              sketches as values, sorted by season.
+    """
+    season_by_match = {}
+    batsman_runs_sketches = {}
+
+    with open("../required_data/matches.csv", encoding="utf-8") as match_file:
+        matches_data = csv.DictReader(match_file)
+
+        for match in matches_data:
+            season_by_match[match["id"]] = int(match["season"])
+
+    with open("../required_data/deliveries.csv", encoding="utf-8") as data:
+        deliveries_data = csv.DictReader(data)
+
+        for delivery in deliveries_data:
+            season = season_by_match.get(delivery["match_id"])
+
+            if season is None or delivery["batting_team"] != "Royal Challengers Bangalore":
+                continue
+
+            if season not in batsman_runs_sketches:
+                batsman_runs_sketches[season] = HeavyHitters(capacity)
+            batsman_runs_sketches[season].add(delivery["batsman"], int(delivery["batsman_runs"]))
+
+    return dict(sorted(batsman_runs_sketches.items()))
+
+
+def calculate_top_ten_batsman_of_rcb(approximate=False):
     """
     Calculate the top ten run-scorers for Royal Challengers Bangalore (RCB)
     by reading the deliveries CSV file and summing individual batsmen's runs.
 
+    Args:
+        approximate (bool): Use a heavy-hitters sketch instead of exact totals.
+                            The error bounds are described in, and can be
+                            read from, build_batsman_runs_sketch_of_rcb().
+
     Returns:
         dict: A dictionary of the top 10 RCB batsmen with their total runs, 
               sorted in descending order.
     """
+    if approximate:
+        return build_batsman_runs_sketch_of_rcb().top(10)
+
     total_batsman_of_rcb = {}
 
     with open("../required_data/deliveries.csv", encoding="utf-8") as data:
@@ -59,14 +136,17 @@ def plot_top_ten_batsman_of_rcb(top_ten_batsman_data):
     plt.show()
 
 
-def execute():
+def execute(approximate=False):
     """
     Execute the data analysis pipeline: calculate and plot
     the top ten RCB batsmen by total runs scored.
+
+    Args:
+        approximate (bool): Use a heavy-hitters sketch instead of exact totals.
     """
-    top_ten_batsman = calculate_top_ten_batsman_of_rcb()
+    top_ten_batsman = calculate_top_ten_batsman_of_rcb(approximate)
     plot_top_ten_batsman_of_rcb(top_ten_batsman)
 
 
 if __name__ == "__main__":
-    execute()
+    execute(approximate="--approximate" in sys.argv[1:])
@@ -11,6 +11,8 @@ import csv
 import matplotlib
 import matplotlib.pyplot as plt
 
+from deliveries_summary import read_deliveries_summary
+
 # Set backend immediately after importing matplotlib
 matplotlib.use('TkAgg')
 
@@ -19,8 +21,8 @@ def calculate_extra_run_conceded_per_team_in_2016():
     Calculates the total extra runs conceded by each team during the 2016 IPL season.
 
     This function first identifies all match IDs from the 2016 season using 'matches.csv',
-    and then sums up the 'extra_runs' from 'deliveries.csv' for each bowling team
-    in those matches.
+    and then sums up the 'extra_runs' from the per-innings summary of 'deliveries.csv'
+    for each bowling team in those matches.
 
     Returns:
         dict: A dictionary with team names as keys and the total extra runs conceded
@@ -37,16 +39,13 @@ def calculate_extra_run_conceded_per_team_in_2016():
                 year_ids.add(match["id"])
 
 
-    with open("../required_data/deliveries.csv", encoding="utf-8") as delivery_file:
-        delivery_data = csv.DictReader(delivery_file)
-
-        for delivery in delivery_data:
-            match_id = delivery["match_id"]
+    for innings in read_deliveries_summary():
+        match_id = innings["match_id"]
 
-            if match_id in year_ids:
-                bowling_team = delivery["bowling_team"]
-                extra_runs = int(delivery["extra_runs"])
-                extra_run_conceded_per_team_in_2016[bowling_team] = extra_run_conceded_per_team_in_2016.get(bowling_team, 0) + extra_runs
+        if match_id in year_ids:
+            bowling_team = innings["bowling_team"]
+            extra_runs = innings["extra_runs"]
+            extra_run_conceded_per_team_in_2016[bowling_team] = extra_run_conceded_per_team_in_2016.get(bowling_team, 0) + extra_runs
     
     return extra_run_conceded_per_team_in_2016
 
@@ -11,6 +11,8 @@ import csv
 import matplotlib
 import matplotlib.pyplot as plt
 
+from deliveries_summary import read_deliveries_summary
+
 # Set backend immediately after importing matplotlib
 matplotlib.use('TkAgg')
 
@@ -19,8 +21,8 @@ def calculate_top_ten_economic_bowler_in_2015():
     """
     Calculates the top 10 most economical bowlers in the IPL 2015 season.
 
-    This function reads match data from 'matches.csv' and delivery data from 'deliveries.csv',
-    filters matches from the 2015 season, calculates the economy rate for each bowler based on
+    This function reads match data from 'matches.csv' and the per-bowler summary of
+    'deliveries.csv', filters matches from the 2015 season, calculates the economy rate for each bowler based on
     legal deliveries and runs conceded (excluding byes and leg byes), and returns a dictionary
     of the top 10 bowlers with the lowest economy rates.
 
@@ -42,25 +44,14 @@ def calculate_top_ten_economic_bowler_in_2015():
             if year == "2015":
                 match_ids_2015.add(ids)
 
-    with open("../required_data/deliveries.csv", encoding="utf-8") as delivery_file:
-        delivery_data = csv.DictReader(delivery_file)
-
-        for delivery in delivery_data:
-            if delivery["match_id"] not in match_ids_2015:
-                continue
-
-            bowler = delivery["bowler"]
-            total_runs = int(delivery["total_runs"])
-            bye_runs = int(delivery["bye_runs"])
-            legbye_runs = int(delivery["legbye_runs"])
-            wide_runs = int(delivery["wide_runs"])
-            noball_runs = int(delivery["noball_runs"])
-
-            runs = total_runs - bye_runs - legbye_runs
-            runs_conceded[bowler] = runs_conceded.get(bowler, 0) + runs
+    for spell in read_deliveries_summary():
+        if spell["match_id"] not in match_ids_2015:
+            continue
 
-            if wide_runs == 0 and noball_runs == 0:
-                legal_deliveries[bowler] = legal_deliveries.get(bowler, 0) + 1
+        bowler = spell["bowler"]
+        runs = spell["total_runs"] - spell["bye_runs"] - spell["legbye_runs"]
+        runs_conceded[bowler] = runs_conceded.get(bowler, 0) + runs
+        legal_deliveries[bowler] = legal_deliveries.get(bowler, 0) + spell["legal_balls"]
 
     economy_rate = {}
 
@@ -0,0 +1,193 @@
+"""
+This module analyzes IPL cricket data to calculate and plot
+the number of distinct players per season and bowlers per team.
+
+It reads data from the 'matches.csv' and 'deliveries.csv' files, counts
+distinct players exactly or approximately with HyperLogLog sketches,
+and displays the results in bar charts.
+"""
+
+import csv
+import sys
+import matplotlib
+import matplotlib.pyplot as plt
+
+from sketches import HyperLogLog
+
+# Set backend immediately after importing matplotlib
+matplotlib.use('TkAgg')
+
+
+def collect_players_per_season(approximate=False):
+    """
+    Collect the distinct players (batsmen and bowlers) of each season.
+
+    A player takes part in many deliveries of a match, so each player is only
+    added to the season once per match. Deliveries of matches missing from
+    'matches.csv' are skipped.
+
+    Args:
+        approximate (bool): Collect into HyperLogLog sketches instead of exact sets.
+
+    Returns:
+        dict: A dictionary with seasons (integers) as keys and either a set of
+              player names or a HyperLogLog sketch as values, sorted by season.
+    """
+    season_by_match = {}
+    players_per_season = {}
+
+    with open("../required_data/matches.csv", encoding="utf-8") as match_file:
+        matches_data = csv.DictReader(match_file)
+
+        for match in matches_data:
+            season_by_match[match["id"]] = int(match["season"])
+
+    with open("../required_data/deliveries.csv", encoding="utf-8") as delivery_file:
+        delivery_data = csv.DictReader(delivery_file)
+        previous_match_id = None
+        match_players = set()
+
+        for delivery in delivery_data:
+            match_id = delivery["match_id"]
+            season = season_by_match.get(match_id)
+
+            if season is None:
+                continue
+
+            if season not in players_per_season:
+                players_per_season[season] = HyperLogLog() if approximate else set()
+            players = players_per_season[season]
+
+            if match_id != previous_match_id:
+                match_players = set()
+                previous_match_id = match_id
+
+            for player in (delivery["batsman"], delivery["non_striker"], delivery["bowler"]):
+                if player not in match_players:
+                    match_players.add(player)
+                    players.add(player)
+
+    return dict(sorted(players_per_season.items()))
+
+
+def calculate_number_of_players_per_season(approximate=False):
+    """
+    Calculate the number of distinct players (batsmen and bowlers) in each season.
+
+    Args:
+        approximate (bool): Count with HyperLogLog sketches instead of exact sets.
+                            Each count then has a relative standard error of
+                            HyperLogLog().relative_error().
+
+    Returns:
+        dict: A dictionary with seasons (integers) as keys and the number of
+              distinct players as values, sorted by season.
+    """
+    number_of_players_per_season = {}
+
+    for season, players in collect_players_per_season(approximate).items():
+        number_of_players_per_season[season] = players.count() if approximate else len(players)
+
+    return number_of_players_per_season
+
+
+def calculate_number_of_bowlers_per_team(approximate=False):
+    """
+    Calculate the number of distinct bowlers who have bowled for each team.
+
+    Args:
+        approximate (bool): Count with HyperLogLog sketches instead of exact sets.
+                            Each count then has a relative standard error of
+                            HyperLogLog().relative_error().
+
+    Returns:
+        dict: A dictionary with team names as keys and the number of distinct
+              bowlers as values.
+    """
+    bowlers_per_team = {}
+
+    with open("../required_data/deliveries.csv", encoding="utf-8") as delivery_file:
+        delivery_data = csv.DictReader(delivery_file)
+        previous_match_id = None
+        match_bowlers = set()
+
+        for delivery in delivery_data:
+            match_id = delivery["match_id"]
+            bowling_team = delivery["bowling_team"]
+            bowler = delivery["bowler"]
+
+            if bowling_team not in bowlers_per_team:
+                bowlers_per_team[bowling_team] = HyperLogLog() if approximate else set()
+
+            if match_id != previous_match_id:
+                match_bowlers = set()
+                previous_match_id = match_id
+
+            # A bowler bowls several overs of a match, so add each one once per match.
+            if (bowling_team, bowler) not in match_bowlers:
+                match_bowlers.add((bowling_team, bowler))
+                bowlers_per_team[bowling_team].add(bowler)
+
+    number_of_bowlers_per_team = {}
+
+    for team, bowlers in bowlers_per_team.items():
+        number_of_bowlers_per_team[team] = bowlers.count() if approximate else len(bowlers)
+
+    return number_of_bowlers_per_team
+
+
+def plot_number_of_players_per_season(number_of_players_per_season):
+    """
+    Plots a bar chart showing the number of distinct players in each season.
+
+    Args:
+        number_of_players_per_season (dict): A dictionary with seasons as keys and
+                                             the number of players as values.
+    """
+    plt.figure(figsize=(14,6))
+    plt.title("Number Of Players Per Season")
+    plt.bar(number_of_players_per_season.keys(), number_of_players_per_season.values(), color="orange")
+    plt.xlabel("Seasons")
+    plt.ylabel("Player Count")
+    plt.xticks(list(number_of_players_per_season.keys()), rotation=45, ha="right")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_number_of_bowlers_per_team(number_of_bowlers_per_team):
+    """
+    Plots a bar chart showing the number of distinct bowlers for each team.
+
+    Args:
+        number_of_bowlers_per_team (dict): A dictionary with team names as keys and
+                                           the number of bowlers as values.
+    """
+    plt.figure(figsize=(14,6))
+    plt.title("Number Of Bowlers Per Team")
+    plt.bar(number_of_bowlers_per_team.keys(), number_of_bowlers_per_team.values(), color="purple")
+    plt.xlabel("Teams")
+    plt.ylabel("Bowler Count")
+    plt.xticks(rotation=45, ha="right")
+    plt.tight_layout()
+    plt.show()
+
+
+def execute(approximate=False):
+    """
+    Executes the full analysis pipeline:
+    - Calculates the number of players per season and bowlers per team.
+    - Plots the results in bar charts.
+
+    Args:
+        approximate (bool): Count with HyperLogLog sketches instead of exact sets.
+    """
+    number_of_players_per_season = calculate_number_of_players_per_season(approximate)
+    plot_number_of_players_per_season(number_of_players_per_season)
+
+    number_of_bowlers_per_team = calculate_number_of_bowlers_per_team(approximate)
+    plot_number_of_bowlers_per_team(number_of_bowlers_per_team)
+
+
+if __name__ == "__main__":
+
+    execute(approximate="--approximate" in sys.argv[1:])
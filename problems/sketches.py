@@ -0,0 +1,384 @@
+"""
+This module provides mergeable sketches for an approximate query mode
+over very large IPL-style archives.
+
+- HyperLogLog estimates distinct counts (players per season, bowlers per
+  team) with a relative standard error of about 1.04 / sqrt(2 ** precision).
+- CountMinSketch estimates per-key totals; an estimate never undercounts
+  and overcounts by at most epsilon * N with probability 1 - delta, where
+  N is the sum of all added values.
+- SpaceSaving keeps the heaviest keys in a fixed number of counters;
+  each reported total overcounts by at most N / capacity.
+- HeavyHitters combines the two for leaderboards such as the top ten
+  batsmen: SpaceSaving picks the candidates and CountMinSketch reports
+  their totals. A key whose true total is at or below N / capacity may
+  be missing from the leaderboard.
+
+Every sketch of the same configuration can be merged, so sketches built
+over separate chunks or seasons combine into one for the whole archive.
+Each key is hashed once per update, and the counters live in compact
+bytearray/array storage, so a sketch stays small however many keys it sees.
+"""
+
+import hashlib
+import heapq
+import math
+from array import array
+
+
+def hash_key(key):
+    """
+    Hash a key to a 64-bit integer.
+
+    Args:
+        key (str): The value to hash.
+
+    Returns:
+        int: A 64-bit hash of the key.
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class HyperLogLog:
+    """
+    Estimate the number of distinct keys added, using 2 ** precision registers.
+    """
+
+    def __init__(self, precision=12):
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+
+    def add(self, key):
+        """
+        Add a key to the sketch.
+
+        Args:
+            key (str): The key to count.
+        """
+        hashed = hash_key(key)
+        index = hashed & (self.num_registers - 1)
+        rank = (64 - self.precision) - (hashed >> self.precision).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        """
+        Merge another sketch with the same precision into this one.
+
+        Args:
+            other (HyperLogLog): The sketch to merge.
+
+        Returns:
+            HyperLogLog: This sketch, after the merge.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self):
+        """
+        Estimate the number of distinct keys added.
+
+        Returns:
+            int: The estimated distinct count.
+        """
+        alpha = 0.7213 / (1 + 1.079 / self.num_registers)
+        estimate = alpha * self.num_registers ** 2 / sum(2.0 ** -r for r in self.registers)
+
+        # Linear counting is more accurate while many registers are still empty.
+        empty_registers = self.registers.count(0)
+        if estimate <= 2.5 * self.num_registers and empty_registers:
+            estimate = self.num_registers * math.log(self.num_registers / empty_registers)
+
+        return round(estimate)
+
+    def relative_error(self):
+        """
+        Return the relative standard error of count().
+
+        Returns:
+            float: The relative standard error.
+        """
+        return 1.04 / math.sqrt(self.num_registers)
+
+
+class CountMinSketch:
+    """
+    Estimate per-key totals in a width x depth table of counters.
+
+    The depth column indices of a key come from one 64-bit hash split into
+    two halves (Kirsch-Mitzenmacher double hashing), so a key is hashed once
+    per update rather than once per row.
+    """
+
+    def __init__(self, epsilon=0.01, delta=0.01):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = array("q", bytes(8 * self.width * self.depth))
+        self.total = 0
+
+    def _cells(self, key):
+        hashed = hash_key(key)
+        first = hashed & 0xFFFFFFFF
+        second = (hashed >> 32) | 1
+        return [row * self.width + (first + row * second) % self.width
+                for row in range(self.depth)]
+
+    def add(self, key, value=1):
+        """
+        Add a non-negative value to the total of a key.
+
+        Args:
+            key (str): The key to update.
+            value (int): The amount to add.
+        """
+        for cell in self._cells(key):
+            self.table[cell] += value
+        self.total += value
+
+    def merge(self, other):
+        """
+        Merge another sketch with the same epsilon and delta into this one.
+
+        Args:
+            other (CountMinSketch): The sketch to merge.
+
+        Returns:
+            CountMinSketch: This sketch, after the merge.
+        """
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge CountMinSketch sketches with different dimensions")
+
+        self.table = array("q", map(sum, zip(self.table, other.table)))
+        self.total += other.total
+        return self
+
+    def estimate(self, key):
+        """
+        Estimate the total of a key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            int: The estimated total, never lower than the true total.
+        """
+        return min(self.table[cell] for cell in self._cells(key))
+
+    def error_bound(self):
+        """
+        Return the maximum overcount of estimate(), holding with probability 1 - delta.
+
+        Returns:
+            float: The error bound.
+        """
+        return self.epsilon * self.total
+
+
+class SpaceSaving:
+    """
+    Track the heaviest keys using at most `capacity` counters.
+
+    A min-heap holds one (count, key) entry per counter. Counts only grow, so
+    an entry may lag behind its counter; stale entries are refreshed only
+    when they reach the top of the heap, which keeps every update cheap.
+    """
+
+    def __init__(self, capacity=50):
+        self.capacity = capacity
+        self.counters = {}
+        self.total = 0
+        self._heap = []
+
+    def _smallest(self):
+        while True:
+            count, key = self._heap[0]
+            if self.counters[key] == count:
+                return count, key
+            heapq.heapreplace(self._heap, (self.counters[key], key))
+
+    def add(self, key, value=1):
+        """
+        Add a non-negative value to the total of a key.
+
+        When all counters are in use, the smallest counter is handed over to
+        the new key, which inherits its count.
+
+        Args:
+            key (str): The key to update.
+            value (int): The amount to add.
+        """
+        self.total += value
+
+        if key in self.counters:
+            self.counters[key] += value
+            return
+
+        if len(self.counters) < self.capacity:
+            self.counters[key] = value
+            heapq.heappush(self._heap, (value, key))
+            return
+
+        smallest_count, smallest_key = self._smallest()
+        del self.counters[smallest_key]
+        self.counters[key] = smallest_count + value
+        heapq.heapreplace(self._heap, (smallest_count + value, key))
+
+    def _minimum(self):
+        if len(self.counters) < self.capacity:
+            return 0
+        return self._smallest()[0]
+
+    def merge(self, other):
+        """
+        Merge another sketch with the same capacity into this one.
+
+        A key missing from one sketch is credited with that sketch's smallest
+        counter, so merged totals still never undercount.
+
+        Args:
+            other (SpaceSaving): The sketch to merge.
+
+        Returns:
+            SpaceSaving: This sketch, after the merge.
+        """
+        if other.capacity != self.capacity:
+            raise ValueError("Cannot merge SpaceSaving sketches with different capacity")
+
+        own_minimum = self._minimum()
+        other_minimum = other._minimum()
+        merged = {}
+
+        for key in set(self.counters) | set(other.counters):
+            merged[key] = (self.counters.get(key, own_minimum)
+                           + other.counters.get(key, other_minimum))
+
+        self.counters = dict(
+            sorted(merged.items(), key=lambda x: x[1], reverse=True)[:self.capacity])
+        self._heap = [(count, key) for key, count in self.counters.items()]
+        heapq.heapify(self._heap)
+        self.total += other.total
+        return self
+
+    def top(self, number):
+        """
+        Return the heaviest keys with their estimated totals.
+
+        Args:
+            number (int): How many keys to return.
+
+        Returns:
+            dict: Keys mapped to estimated totals, sorted in descending order.
+        """
+        return dict(sorted(self.counters.items(), key=lambda x: x[1], reverse=True)[:number])
+
+    def error_bound(self):
+        """
+        Return the maximum overcount of a reported total.
+
+        Returns:
+            float: The error bound.
+        """
+        return self.total / self.capacity
+
+
+class HeavyHitters:
+    """
+    Keep a leaderboard of the heaviest keys: a SpaceSaving sketch picks the
+    candidate keys and a CountMinSketch supplies their totals, which are much
+    tighter than the SpaceSaving counters alone.
+
+    Every key whose true total is above membership_bound() is kept as a
+    candidate; a key at or below it may be evicted and missing from top().
+    Each reported total overcounts by at most error_bound(), with probability
+    1 - delta.
+
+    Consecutive updates to the same key are summed before they reach the
+    sketches, since a stream such as deliveries repeats a batsman ball after ball.
+    """
+
+    def __init__(self, capacity=50, epsilon=0.01, delta=0.01):
+        self.candidates = SpaceSaving(capacity)
+        self.totals = CountMinSketch(epsilon, delta)
+        self._pending_key = None
+        self._pending_value = 0
+
+    def _flush(self):
+        if self._pending_key is not None:
+            self.candidates.add(self._pending_key, self._pending_value)
+            self.totals.add(self._pending_key, self._pending_value)
+            self._pending_key = None
+            self._pending_value = 0
+
+    def add(self, key, value=1):
+        """
+        Add a non-negative value to the total of a key.
+
+        Args:
+            key (str): The key to update.
+            value (int): The amount to add.
+        """
+        if key == self._pending_key:
+            self._pending_value += value
+            return
+
+        self._flush()
+        self._pending_key = key
+        self._pending_value = value
+
+    def merge(self, other):
+        """
+        Merge another leaderboard with the same configuration into this one.
+
+        Args:
+            other (HeavyHitters): The leaderboard to merge.
+
+        Returns:
+            HeavyHitters: This leaderboard, after the merge.
+        """
+        self._flush()
+        other._flush()
+        self.candidates.merge(other.candidates)
+        self.totals.merge(other.totals)
+        return self
+
+    def top(self, number):
+        """
+        Return the heaviest keys with their estimated totals.
+
+        Args:
+            number (int): How many keys to return.
+
+        Returns:
+            dict: Keys mapped to estimated totals, sorted in descending order.
+        """
+        self._flush()
+        estimates = {key: self.totals.estimate(key) for key in self.candidates.counters}
+        return dict(sorted(estimates.items(), key=lambda x: x[1], reverse=True)[:number])
+
+    def error_bound(self):
+        """
+        Return the maximum overcount of a reported total, holding with
+        probability 1 - delta.
+
+        Returns:
+            float: The error bound.
+        """
+        self._flush()
+        return self.totals.error_bound()
+
+    def membership_bound(self):
+        """
+        Return the total above which a key is always kept as a candidate.
+
+        Returns:
+            float: The membership bound.
+        """
+        self._flush()
+        return self.candidates.error_bound()